@@ -29,7 +29,7 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 -------------------------------------------------------------------------------
 """
 
-from typing import Union, List, Tuple, Any, Callable, Sequence, Mapping, Optional
+from typing import Union, List, Tuple, Any, Callable, Sequence, Mapping, Optional, Generator, Set
 
 # noinspection PyUnresolvedReferences
 from typing import Dict, Type  # lgtm [py/unused-import]
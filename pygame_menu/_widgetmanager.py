@@ -31,11 +31,12 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 __all__ = ['WidgetManager']
 
-import textwrap
 import warnings
+from collections import OrderedDict
+from contextlib import contextmanager
 from io import BytesIO
+from itertools import count
 from pathlib import Path
-from uuid import uuid4
 
 import pygame_menu
 import pygame_menu.widgets
@@ -47,7 +48,284 @@ import pygame_menu.utils as _utils
 from pygame_menu.widgets.widget.colorinput import ColorInputColorType, ColorInputHexFormatType
 from pygame_menu.widgets.widget.textinput import TextInputModeType
 from pygame_menu._types import Any, Union, Callable, Dict, Optional, CallbackType, \
-    NumberType, Vector2NumberType, List, Tuple
+    NumberType, Vector2NumberType, List, Tuple, Generator
+
+
+def _assert_background_color(color: Any) -> None:
+    """
+    Assert the widget background color, it can be a color, an image, or ``None``.
+
+    :param color: Background color
+    :return: None
+    """
+    if color is not None and not isinstance(color, pygame_menu.BaseImage):
+        _utils.assert_color(color)
+
+
+def _assert_background_inflate(inflate: Any) -> None:
+    """
+    Assert the widget background inflate.
+
+    :param inflate: Background inflate *(x, y)*
+    :return: None
+    """
+    _utils.assert_vector(inflate, 2)
+    assert inflate[0] >= 0 and inflate[1] >= 0, \
+        'both background inflate components must be equal or greater than zero'
+
+
+def _assert_border_inflate(inflate: Any) -> None:
+    """
+    Assert the widget border inflate.
+
+    :param inflate: Border inflate *(x, y)*
+    :return: None
+    """
+    _utils.assert_vector(inflate, 2)
+    assert isinstance(inflate[0], int) and inflate[0] >= 0
+    assert isinstance(inflate[1], int) and inflate[1] >= 0
+
+
+def _assert_border_width(width: Any) -> None:
+    """
+    Assert the widget border width.
+
+    :param width: Border width
+    :return: None
+    """
+    assert isinstance(width, int) and width >= 0
+
+
+def _assert_font_name(name: Any) -> None:
+    """
+    Assert the widget font name.
+
+    :param name: Font name or path
+    :return: None
+    """
+    assert isinstance(name, (str, Path))
+
+
+def _assert_font_size(size: Any) -> None:
+    """
+    Assert the widget font size.
+
+    :param size: Font size
+    :return: None
+    """
+    assert isinstance(size, int)
+    assert size > 0, 'font size must be greater than zero'
+
+
+def _assert_margin(margin: Any) -> None:
+    """
+    Assert the widget margin.
+
+    :param margin: Margin *(left, bottom)*
+    :return: None
+    """
+    assert isinstance(margin, tuple)
+    assert len(margin) == 2, 'margin must be a tuple or list of 2 numbers'
+
+
+def _assert_padding(padding: Any) -> None:
+    """
+    Assert the widget padding.
+
+    :param padding: Padding
+    :return: None
+    """
+    assert isinstance(padding, (int, float, tuple))
+
+
+def _assert_selection_effect(selection: Any) -> None:
+    """
+    Assert the widget selection effect, ``None`` is replaced by a NoneSelection.
+
+    :param selection: Selection effect
+    :return: None
+    """
+    assert selection is None or isinstance(selection, pygame_menu.widgets.core.Selection)
+
+
+def _assert_shadow(shadow: Any) -> None:
+    """
+    Assert the widget shadow status.
+
+    :param shadow: Shadow is enabled
+    :return: None
+    """
+    assert isinstance(shadow, bool)
+
+
+def _assert_shadow_offset(offset: Any) -> None:
+    """
+    Assert the widget shadow offset.
+
+    :param offset: Shadow offset
+    :return: None
+    """
+    assert isinstance(offset, (int, float))
+
+
+def _assert_str(value: Any) -> None:
+    """
+    Assert the value is a string.
+
+    :param value: Value
+    :return: None
+    """
+    assert isinstance(value, str)
+
+
+# Widget attributes that can be defined through the widget addition kwargs, as
+# (kwarg key, theme attribute, validator). If the validator is None the value is
+# not checked
+_WIDGET_ATTRS = (
+    ('align', 'widget_alignment', _assert_str),
+    ('background_color', 'widget_background_color', _assert_background_color),
+    ('background_inflate', 'widget_background_inflate', _assert_background_inflate),
+    ('border_color', 'widget_border_color', _utils.assert_color),
+    ('border_inflate', 'widget_border_inflate', _assert_border_inflate),
+    ('border_width', 'widget_border_width', _assert_border_width),
+    ('font_background_color', 'widget_font_background_color', None),
+    ('font_color', 'widget_font_color', _utils.assert_color),
+    ('font_name', 'widget_font', _assert_font_name),
+    ('font_size', 'widget_font_size', _assert_font_size),
+    ('margin', 'widget_margin', _assert_margin),
+    ('padding', 'widget_padding', _assert_padding),
+    ('readonly_color', 'readonly_color', _utils.assert_color),
+    ('readonly_selected_color', 'readonly_selected_color', _utils.assert_color),
+    ('selection_color', 'selection_color', _utils.assert_color),
+    ('selection_effect', 'widget_selection_effect', _assert_selection_effect),
+    ('shadow', 'widget_shadow', _assert_shadow),
+    ('shadow_color', 'widget_shadow_color', _utils.assert_color),
+    ('shadow_position', 'widget_shadow_position', _assert_str),
+    ('shadow_offset', 'widget_shadow_offset', _assert_shadow_offset)
+)
+_WIDGET_ATTR_KEYS = frozenset(attr[0] for attr in _WIDGET_ATTRS)
+_WIDGET_ATTR_VALIDATORS = {attr[0]: attr[2] for attr in _WIDGET_ATTRS}
+
+# Widget attributes whose value is one of the locals strings
+_LOCALS_KEYS = ('align', 'shadow_position')
+
+# Maps each locals value to itself, thus, the lookup of an equal string returns
+# the canonical locals object. The widgets compare these values against the
+# locals on each render, which is faster if both are the same object
+_LOCALS_VALUES = {
+    value: value for value in (
+        _locals.ALIGN_CENTER, _locals.ALIGN_LEFT, _locals.ALIGN_RIGHT,
+        _locals.INPUT_FLOAT, _locals.INPUT_INT, _locals.INPUT_TEXT,
+        _locals.POSITION_CENTER, _locals.POSITION_EAST, _locals.POSITION_NORTH,
+        _locals.POSITION_NORTHEAST, _locals.POSITION_NORTHWEST, _locals.POSITION_SOUTH,
+        _locals.POSITION_SOUTHEAST, _locals.POSITION_SOUTHWEST, _locals.POSITION_WEST
+    )
+}
+
+
+def _get_locals_value(value: Any) -> Any:
+    """
+    Return the locals object equal to the given value, or the same value if
+    there is none.
+
+    :param value: Value
+    :return: Locals object or value
+    """
+    if isinstance(value, str):
+        return _LOCALS_VALUES.get(value, value)
+    return value
+
+
+# Widget attributes ignored by the image widget
+_IMAGE_STRIP_KEYS = frozenset((
+    'font_background_color',
+    'font_color',
+    'font_name',
+    'font_size',
+    'shadow',
+    'shadow_color',
+    'shadow_position',
+    'shadow_offset'
+))
+
+# Toggle switch optional kwargs (key, default value), passed to the widget
+_TOGGLE_SWITCH_DEFAULTS = (
+    ('infinite', False),
+    ('slider_color', (255, 255, 255)),
+    ('slider_thickness', 20),
+    ('state_color', ((178, 178, 178), (117, 185, 54))),
+    ('state_text_font_color', ((255, 255, 255), (255, 255, 255))),
+    ('state_text_font_size', None),
+    ('switch_border_color', (40, 40, 40)),
+    ('switch_border_width', 1),
+    ('switch_height', 1.25),
+    ('switch_margin', (25, 0))
+)
+
+# Stores the selection effect shared by the widgets added without effect
+_none_selection = [None]
+
+
+def _get_none_selection() -> 'pygame_menu.widgets.NoneSelection':
+    """
+    Return the NoneSelection object shared by the widgets. The widgets do not modify
+    their selection effect, thus, the same object can be used by all of them.
+
+    :return: NoneSelection object
+    """
+    if _none_selection[0] is None:
+        _none_selection[0] = pygame_menu.widgets.NoneSelection()
+    return _none_selection[0]
+
+
+# Max number of sets of overridden attributes cached by each WidgetManager
+_ATTR_CACHE_SIZE = 32
+
+# Types of the attribute values that can be cached
+_ATTR_CACHE_TYPES = (bool, int, float, str, type(None))
+
+
+def _get_attr_cache_key(value: Any) -> Any:
+    """
+    Return the cache key of an attribute value. The key contains the type of
+    the value and of each item within tuples, as ``1``, ``1.0`` and ``True``
+    are equal but not always valid.
+
+    Only tuples and values of ``_ATTR_CACHE_TYPES`` are cached, other values
+    (lists, images, selection effects, etc.) raise ``TypeError``.
+
+    :param value: Attribute value
+    :return: Cache key
+    """
+    value_type = type(value)
+    if value_type is tuple:
+        return value_type, tuple(_get_attr_cache_key(v) for v in value)
+    if value_type not in _ATTR_CACHE_TYPES:
+        raise TypeError('{0} values are not cached'.format(value_type.__name__))
+    return value_type, value
+
+
+# Generates the ids of the labels added without id
+_label_id_counter = count()
+
+# Stores the text wrapper of each width used by the labels
+_text_wrappers = {}
+
+
+def _get_text_wrapper(width: int) -> Any:
+    """
+    Return the text wrapper of the given width. The wrappers are created once
+    and reused, as ``textwrap.wrap`` creates a new one on each call.
+
+    :param width: Max length of the wrapped lines
+    :return: Text wrapper (``textwrap.TextWrapper``)
+    """
+    wrapper = _text_wrappers.get(width)
+    if wrapper is None:
+        import textwrap  # Only imported if any label is wrapped
+        wrapper = textwrap.TextWrapper(width)
+        _text_wrappers[width] = wrapper
+    return wrapper
 
 
 # noinspection PyProtectedMember
@@ -57,10 +335,86 @@ class WidgetManager(object):
 
     :param menu: Menu reference
     """
+    __slots__ = (
+        '_attr_cache',
+        '_autochar_label',
+        '_autochar_label_attrs',
+        '_batch_depth',
+        '_button_actions',
+        '_menu',
+        '_menu_cls',
+        '_theme_defaults',
+        '_theme_defaults_key'
+    )
+    _attr_cache: Dict[frozenset, Dict[str, Any]]
+    _autochar_label: Optional['pygame_menu.widgets.Label']
+    _autochar_label_attrs: Optional[Dict[str, Any]]
+    _batch_depth: int
+    _button_actions: Dict['_events.MenuAction', Callable[[int], Tuple[Optional[Callable], Tuple]]]
     _menu: 'pygame_menu.Menu'
+    _menu_cls: type
+    _theme_defaults: Optional[Dict[str, Any]]
+    _theme_defaults_key: Optional[Tuple['_themes.Theme', int]]
 
     def __init__(self, menu: 'pygame_menu.Menu') -> None:
         self._menu = menu
+        self._menu_cls = type(menu)
+
+        # Number of nested batch blocks, while greater than zero the Menu is not
+        # rendered after each widget addition
+        self._batch_depth = 0
+
+        # Widget attributes computed from the theme, these are reused while
+        # the theme (and its version) does not change
+        self._theme_defaults = None
+        self._theme_defaults_key = None
+
+        # Widget attributes of the last sets of overridden values (least recently
+        # used first), cleared when the theme defaults are computed again
+        self._attr_cache = OrderedDict()
+
+        # Label used to measure the titles if max_char is -1, reused while the
+        # attributes do not change
+        self._autochar_label = None
+        self._autochar_label_attrs = None
+
+        # Button callback and arguments of each MenuAction, these receive the
+        # number of menus to go back
+        self._button_actions = {
+            _events.BACK: lambda back_count: (menu.reset, (back_count,)),
+            _events.CLOSE: lambda back_count: (menu._close, ()),
+            _events.EXIT: lambda back_count: (menu._exit, ()),
+            _events.NONE: lambda back_count: (None, ()),
+            _events.RESET: lambda back_count: (menu.full_reset, ())
+        }
+
+    @contextmanager
+    def batch(self) -> Generator[None, None, None]:
+        """
+        Context manager that renders the Menu only once after adding several
+        widgets, instead of rendering it after each addition. Useful for building
+        Menus with many widgets:
+
+        .. code-block:: python
+
+            with menu.add.batch():
+                for i in range(100):
+                    menu.add.label('Label {0}'.format(i))
+
+        .. note::
+
+            The widgets position and the Menu size are not updated until the
+            block ends.
+
+        :return: None
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._menu._render()
 
     @property
     def _theme(self) -> '_themes.Theme':
@@ -79,109 +433,132 @@ class WidgetManager(object):
         :param kwargs: Optional keyword arguments (input attributes)
         :return: Dictionary of valid attributes
         """
-        attributes = {}
-        align = kwargs.pop('align', self._theme.widget_alignment)
-        assert isinstance(align, str)
-        attributes['align'] = align
-
-        background_is_color = False
-        background_color = kwargs.pop('background_color', self._theme.widget_background_color)
-        if background_color is not None:
-            if isinstance(background_color, pygame_menu.BaseImage):
-                pass
-            else:
-                _utils.assert_color(background_color)
-                background_is_color = True
-        attributes['background_color'] = background_color
-
-        background_inflate = kwargs.pop('background_inflate', self._theme.widget_background_inflate)
-        _utils.assert_vector(background_inflate, 2)
-        assert background_inflate[0] >= 0 and background_inflate[1] >= 0, \
-            'both background inflate components must be equal or greater than zero'
-        attributes['background_inflate'] = background_inflate
-
-        border_color = kwargs.pop('border_color', self._theme.widget_border_color)
-        _utils.assert_color(border_color)
-        attributes['border_color'] = border_color
+        theme = self._menu.get_theme()
+        theme_key = (theme, theme._version)
+        if self._theme_defaults_key != theme_key:
+            self._theme_defaults = self._get_theme_attributes(theme)
+            self._theme_defaults_key = theme_key
+            self._attr_cache.clear()
+
+        # Most widgets are added without overriding any attribute
+        if not kwargs:
+            return self._theme_defaults.copy()
+
+        overrides = {}
+        for key in tuple(kwargs):  # Usually kwargs has fewer keys than the attributes
+            if key in _WIDGET_ATTR_KEYS:
+                overrides[key] = kwargs.pop(key)
+
+        # If no attribute is overridden the theme defaults are used
+        if not overrides:
+            return self._theme_defaults.copy()
+
+        # Only the overridden values are validated, the others come from the theme
+        if __debug__:
+            for key, value in overrides.items():
+                validator = _WIDGET_ATTR_VALIDATORS[key]
+                if validator is not None:
+                    validator(value)
+
+        try:
+            cache_key = frozenset((k, _get_attr_cache_key(v)) for k, v in overrides.items())
+        except TypeError:  # Value not cached, like a list or an image
+            cache_key = None
+        else:
+            attributes = self._attr_cache.get(cache_key)
+            if attributes is not None:
+                self._attr_cache.move_to_end(cache_key)
+                return attributes.copy()
+
+        attributes = self._theme_defaults.copy()
+        attributes.update(overrides)
+
+        if 'background_color' in overrides or 'font_background_color' in overrides:
+            attributes['font_background_color'] = self._get_font_background_color(
+                theme,
+                attributes['background_color'],
+                overrides.get('font_background_color', theme.widget_font_background_color)
+            )
+        if 'font_name' in overrides and not isinstance(overrides['font_name'], str):
+            attributes['font_name'] = str(overrides['font_name'])
+        if attributes['selection_effect'] is None:
+            attributes['selection_effect'] = _get_none_selection()
+        for key in _LOCALS_KEYS:
+            if key in overrides:
+                attributes[key] = _get_locals_value(overrides[key])
+
+        if cache_key is not None:
+            self._attr_cache[cache_key] = attributes.copy()
+            if len(self._attr_cache) > _ATTR_CACHE_SIZE:
+                self._attr_cache.popitem(last=False)
+        return attributes
 
-        border_inflate = kwargs.pop('border_inflate', self._theme.widget_border_inflate)
-        _utils.assert_vector(border_inflate, 2)
-        assert isinstance(border_inflate[0], int) and border_inflate[0] >= 0
-        assert isinstance(border_inflate[1], int) and border_inflate[1] >= 0
-        attributes['border_inflate'] = border_inflate
+    @staticmethod
+    def _get_theme_attributes(theme: '_themes.Theme') -> Dict[str, Any]:
+        """
+        Return the validated widget attributes defined by the theme.
 
-        border_width = kwargs.pop('border_width', self._theme.widget_border_width)
-        assert isinstance(border_width, int) and border_width >= 0
-        attributes['border_width'] = border_width
+        :param theme: Menu theme
+        :return: Dictionary of valid attributes
+        """
+        attributes = {}
+        for key, theme_attr, validator in _WIDGET_ATTRS:
+            value = getattr(theme, theme_attr)
+            if __debug__ and validator is not None:
+                validator(value)
+            attributes[key] = value
+
+        attributes['font_antialias'] = theme.widget_font_antialias
+        attributes['font_background_color'] = WidgetManager._get_font_background_color(
+            theme,
+            attributes['background_color'],
+            attributes['font_background_color']
+        )
+        attributes['font_name'] = str(attributes['font_name'])
+        if attributes['selection_effect'] is None:
+            attributes['selection_effect'] = _get_none_selection()
 
-        attributes['font_antialias'] = self._theme.widget_font_antialias
+        return attributes
 
-        font_background_color = kwargs.pop('font_background_color', self._theme.widget_font_background_color)
+    @staticmethod
+    def _get_font_background_color(theme: '_themes.Theme',
+                                   background_color: Any,
+                                   font_background_color: Any
+                                   ) -> Any:
+        """
+        Return the widget font background color. If not defined, it uses the Menu
+        background color if the theme requires it and the widget background is not
+        a color.
+
+        :param theme: Menu theme
+        :param background_color: Widget background color
+        :param font_background_color: Widget font background color
+        :return: Font background color
+        """
+        background_is_color = background_color is not None and \
+            not isinstance(background_color, pygame_menu.BaseImage)
         if font_background_color is None and \
-                self._theme.widget_font_background_color_from_menu and \
+                theme.widget_font_background_color_from_menu and \
                 not background_is_color:
-            if isinstance(self._theme.background_color, tuple):  # Is color
-                _utils.assert_color(self._theme.background_color)
-                font_background_color = self._theme.background_color
-        attributes['font_background_color'] = font_background_color
-
-        font_color = kwargs.pop('font_color', self._theme.widget_font_color)
-        _utils.assert_color(font_color)
-        attributes['font_color'] = font_color
-
-        font_name = kwargs.pop('font_name', self._theme.widget_font)
-        assert isinstance(font_name, (str, Path))
-        attributes['font_name'] = str(font_name)
-
-        font_size = kwargs.pop('font_size', self._theme.widget_font_size)
-        assert isinstance(font_size, int)
-        assert font_size > 0, 'font size must be greater than zero'
-        attributes['font_size'] = font_size
-
-        margin = kwargs.pop('margin', self._theme.widget_margin)
-        assert isinstance(margin, tuple)
-        assert len(margin) == 2, 'margin must be a tuple or list of 2 numbers'
-        attributes['margin'] = margin
-
-        padding = kwargs.pop('padding', self._theme.widget_padding)
-        assert isinstance(padding, (int, float, tuple))
-        attributes['padding'] = padding
-
-        readonly_color = kwargs.pop('readonly_color', self._theme.readonly_color)
-        _utils.assert_color(readonly_color)
-        attributes['readonly_color'] = readonly_color
-
-        readonly_selected_color = kwargs.pop('readonly_selected_color', self._theme.readonly_selected_color)
-        _utils.assert_color(readonly_selected_color)
-        attributes['readonly_selected_color'] = readonly_selected_color
-
-        selection_color = kwargs.pop('selection_color', self._theme.selection_color)
-        _utils.assert_color(selection_color)
-        attributes['selection_color'] = selection_color
-
-        selection_effect = kwargs.pop('selection_effect', self._theme.widget_selection_effect)
-        if selection_effect is None:
-            selection_effect = pygame_menu.widgets.NoneSelection()
-        assert isinstance(selection_effect, pygame_menu.widgets.core.Selection)
-        attributes['selection_effect'] = selection_effect
-
-        shadow = kwargs.pop('shadow', self._theme.widget_shadow)
-        assert isinstance(shadow, bool)
-        attributes['shadow'] = shadow
-
-        shadow_color = kwargs.pop('shadow_color', self._theme.widget_shadow_color)
-        _utils.assert_color(shadow_color)
-        attributes['shadow_color'] = shadow_color
-
-        shadow_position = kwargs.pop('shadow_position', self._theme.widget_shadow_position)
-        assert isinstance(shadow_position, str)
-        attributes['shadow_position'] = shadow_position
-
-        shadow_offset = kwargs.pop('shadow_offset', self._theme.widget_shadow_offset)
-        assert isinstance(shadow_offset, (int, float))
-        attributes['shadow_offset'] = shadow_offset
+            if isinstance(theme.background_color, tuple):  # Is color
+                if __debug__:
+                    _utils.assert_color(theme.background_color)
+                font_background_color = theme.background_color
+        return font_background_color
 
-        return attributes
+    def _get_autochar_label(self, attributes: Dict[str, Any]) -> 'pygame_menu.widgets.Label':
+        """
+        Return the label used to measure the titles wrapped to the Menu width.
+        The label is configured again only if the attributes change.
+
+        :param attributes: Widget attributes
+        :return: Label
+        """
+        if self._autochar_label is None or self._autochar_label_attrs != attributes:
+            self._autochar_label = pygame_menu.widgets.Label(title='')
+            self._autochar_label_attrs = attributes
+            self._configure_widget(self._autochar_label, **attributes)
+        return self._autochar_label
 
     @staticmethod
     def _check_kwargs(kwargs: Dict) -> None:
@@ -191,8 +568,8 @@ class WidgetManager(object):
         :param kwargs: Kwargs dict
         :return: None
         """
-        for invalid_keyword in kwargs.keys():
-            msg = 'widget addition optional parameter kwargs.{} is not valid'.format(invalid_keyword)
+        if kwargs:
+            msg = 'widget addition optional parameter kwargs.{} is not valid'.format(next(iter(kwargs)))
             raise ValueError(msg)
 
     def _append_widget(self, widget: 'pygame_menu.widgets.Widget') -> None:
@@ -202,15 +579,19 @@ class WidgetManager(object):
         :param widget: Widget object
         :return: None
         """
+        menu = self._menu
+        widgets = menu._widgets
         assert isinstance(widget, pygame_menu.widgets.Widget)
-        assert widget.get_menu() == self._menu, 'widget cannot have a different instance of menu'
-        self._menu._widgets.append(widget)
-        if self._menu._index < 0 and widget.is_selectable:
+        assert widget.get_menu() is menu, 'widget cannot have a different instance of menu'
+        widgets.append(widget)
+        menu._widget_ids.add(widget.get_id())
+        if menu._index < 0 and widget.is_selectable:
             widget.select()
-            self._menu._index = len(self._menu._widgets) - 1
-        self._menu._stats.added_widgets += 1
-        self._menu._widgets_surface = None  # If added on execution time forces the update of the surface
-        self._menu._render()
+            menu._index = len(widgets) - 1
+        menu._stats.added_widgets += 1
+        menu._widgets_version += 1  # Forces the update of the surface on the next render
+        if not self._batch_depth:
+            menu._render()
 
     def _configure_widget(self, widget: 'pygame_menu.widgets.Widget', **kwargs) -> None:
         """
@@ -224,8 +605,9 @@ class WidgetManager(object):
         assert isinstance(widget, pygame_menu.widgets.Widget)
         assert widget.get_menu() is None, 'widget cannot have an instance of menu'
 
-        widget.set_menu(self._menu)
-        self._menu._check_id_duplicated(widget.get_id())
+        menu = self._menu
+        widget.set_menu(menu)
+        menu._check_id_duplicated(widget.get_id())
 
         widget.set_alignment(
             align=kwargs['align']
@@ -240,9 +622,9 @@ class WidgetManager(object):
             inflate=kwargs['border_inflate']
         )
         widget.set_controls(
-            joystick=self._menu._joystick,
-            mouse=self._menu._mouse,
-            touchscreen=self._menu._touchscreen
+            joystick=menu._joystick,
+            mouse=menu._mouse,
+            touchscreen=menu._touchscreen
         )
         widget.set_font(
             antialias=kwargs['font_antialias'],
@@ -254,9 +636,10 @@ class WidgetManager(object):
             readonly_selected_color=kwargs['readonly_selected_color'],
             selected_color=kwargs['selection_color']
         )
+        margin_x, margin_y = kwargs['margin']
         widget.set_margin(
-            x=kwargs['margin'][0],
-            y=kwargs['margin'][1]
+            x=margin_x,
+            y=margin_y
         )
         widget.set_padding(
             padding=kwargs['padding']
@@ -271,6 +654,33 @@ class WidgetManager(object):
             position=kwargs['shadow_position']
         )
 
+    def _add_label(self,
+                   label_id: str,
+                   title: str,
+                   onselect: Optional[Callable[[bool, 'pygame_menu.widgets.Widget', 'pygame_menu.Menu'], Any]],
+                   selectable: bool,
+                   attributes: Dict[str, Any]
+                   ) -> 'pygame_menu.widgets.Label':
+        """
+        Create a label, configure and add it to the Menu.
+
+        :param label_id: ID of the label
+        :param title: Text to be displayed
+        :param onselect: Callback executed when selecting the widget
+        :param selectable: Label accepts user selection
+        :param attributes: Widget attributes
+        :return: Widget object
+        """
+        widget = pygame_menu.widgets.Label(
+            label_id=label_id,
+            onselect=onselect,
+            title=title
+        )
+        widget.is_selectable = selectable
+        self._configure_widget(widget=widget, **attributes)
+        self._append_widget(widget)
+        return widget
+
     def button(self,
                title: Any,
                action: Optional[Union['pygame_menu.Menu', '_events.MenuAction', Callable, int]],
@@ -369,40 +779,33 @@ class WidgetManager(object):
         attributes = self._filter_widget_attributes(kwargs)
 
         # Change action if certain events
-        if action == _events.PYGAME_QUIT or action == _events.PYGAME_WINDOWCLOSE:
-            action = _events.EXIT
-        elif action is None:
+        if action is None:
             action = _events.NONE
+        elif isinstance(action, int) and action in (_events.PYGAME_QUIT, _events.PYGAME_WINDOWCLOSE):
+            action = _events.EXIT
+
+        button_action = None
+        if isinstance(action, _events.MenuAction):
+            button_action = self._button_actions.get(action)
 
         # If element is a Menu
-        if isinstance(action, type(self._menu)):
+        if isinstance(action, self._menu_cls):
             # Check for recursive
-            if action == self._menu or action.in_submenu(self._menu, recursive=True):
+            if action is self._menu or self._menu in action._submenu_closure:
                 msg = 'Menu "{0}" is already on submenu structure, recursive menus lead ' \
                       'to unexpected behaviours. For returning to previous menu use ' \
                       'pygame_menu.events.BACK event defining an optional back_count ' \
                       'number of menus to return from, default is 1'.format(action.get_title())
                 raise ValueError(msg)
 
-            self._menu._submenus.append(action)
+            self._menu._add_submenu(action)
             widget = pygame_menu.widgets.Button(title, button_id, self._menu._open, action)
             widget.to_menu = True
 
         # If element is a MenuAction
-        elif action == _events.BACK:  # Back to Menu
-            widget = pygame_menu.widgets.Button(title, button_id, self._menu.reset, total_back)
-
-        elif action == _events.CLOSE:  # Close Menu
-            widget = pygame_menu.widgets.Button(title, button_id, self._menu._close)
-
-        elif action == _events.EXIT:  # Exit program
-            widget = pygame_menu.widgets.Button(title, button_id, self._menu._exit)
-
-        elif action == _events.NONE:  # None action
-            widget = pygame_menu.widgets.Button(title, button_id)
-
-        elif action == _events.RESET:  # Back to Top Menu
-            widget = pygame_menu.widgets.Button(title, button_id, self._menu.full_reset)
+        elif button_action is not None:
+            onreturn, onreturn_args = button_action(total_back)
+            widget = pygame_menu.widgets.Button(title, button_id, onreturn, *onreturn_args)
 
         # If element is a function or callable
         elif _utils.is_callable(action):
@@ -597,9 +1000,8 @@ class WidgetManager(object):
         assert isinstance(selectable, bool)
 
         # Remove invalid keys from kwargs
-        for key in ['font_background_color', 'font_color', 'font_name', 'font_size', 'shadow', 'shadow_color',
-                    'shadow_position', 'shadow_offset']:
-            kwargs.pop(key, None)
+        for key in _IMAGE_STRIP_KEYS & kwargs.keys():
+            del kwargs[key]
 
         # Filter widget attributes to avoid passing them to the callbacks
         attributes = self._filter_widget_attributes(kwargs)
@@ -683,64 +1085,48 @@ class WidgetManager(object):
 
         title = str(title)
         if len(label_id) == 0:
-            label_id = str(uuid4())
-
-        # If newline detected, split in two new lines
-        if '\n' in title:
-            title = title.split('\n')
-            widgets = []
-            for t in title:
-                wig = self.label(
-                    title=t,
-                    label_id=label_id + '+' + str(len(widgets) + 1),
-                    max_char=max_char,
-                    onselect=onselect,
-                    selectable=selectable,
-                    **kwargs
-                )
-                if isinstance(wig, list):
-                    for w in wig:
-                        widgets.append(w)
-                else:
-                    widgets.append(wig)
-            return widgets
+            label_id = '_label_{0}'.format(next(_label_id_counter))
+            while label_id in self._menu._widget_ids:  # Skip the ids set by the user
+                label_id = '_label_{0}'.format(next(_label_id_counter))
 
-        # Wrap text to Menu width (imply additional calls to render functions)
-        if max_char < 0:
-            dummy_attrs = self._filter_widget_attributes(kwargs.copy())
-            dummy = pygame_menu.widgets.Label(title=title)
-            self._configure_widget(dummy, **dummy_attrs)
-            max_char = int(1.0 * self._menu.get_width(inner=True) * len(title) / dummy.get_width())
-
-        # If no overflow
-        if len(title) <= max_char or max_char == 0:
-            attributes = self._filter_widget_attributes(kwargs)
-            widget = pygame_menu.widgets.Label(
-                label_id=label_id,
-                onselect=onselect,
-                title=title
-            )
-            widget.is_selectable = selectable
-            self._check_kwargs(kwargs)
-            self._configure_widget(widget=widget, **attributes)
-            self._append_widget(widget)
+        attributes = self._filter_widget_attributes(kwargs)
+        self._check_kwargs(kwargs)
 
-        else:
-            self._menu._check_id_duplicated(label_id)  # Before adding + LEN
-            widget = []
-            for line in textwrap.wrap(title, max_char):
-                widget.append(
-                    self.label(
-                        title=line,
-                        label_id=label_id + '+' + str(len(widget) + 1),
-                        max_char=max_char,
-                        onselect=onselect,
-                        selectable=selectable,
-                        **kwargs
-                    )
-                )
+        # Single line without overflow; the newline is checked last, as it scans
+        # the whole title
+        if max_char == 0 or len(title) <= max_char:
+            if '\n' not in title:
+                return self._add_label(label_id, title, onselect, selectable, attributes)
+
+        # If newline detected, split in several lines. Each line is split again
+        # if it overflows max_char
+        multiline = '\n' in title
+        wrapped = False
+        labels = []  # (label_id, title) of each label
+        for line in title.split('\n') if multiline else (title,):
+            # The line number counts the wrapped lines before it
+            line_id = '{0}+{1}'.format(label_id, len(labels) + 1) if multiline else label_id
+            line_max_char = max_char
+            if max_char < 0:  # Wrap text to Menu width (imply additional calls to render functions)
+                dummy = self._get_autochar_label(attributes).set_title(line)
+                line_max_char = int(1.0 * self._menu.get_width(inner=True) * len(line) / dummy.get_width())
+            # If no overflow
+            if len(line) <= line_max_char or line_max_char == 0:
+                labels.append((line_id, line))
+            else:
+                self._menu._check_id_duplicated(line_id)  # Before adding + LEN
+                wrapped = True
+                wrap_prefix = line_id + '+'
+                for i, wrap_line in enumerate(_get_text_wrapper(line_max_char).wrap(line), 1):
+                    labels.append((wrap_prefix + str(i), wrap_line))
 
-        return widget
+        widgets = []
+        for line_id, line in labels:
+            widgets.append(self._add_label(line_id, line, onselect, selectable, attributes))
+
+        if multiline or wrapped:
+            return widgets
+        return widgets[0]
 
     def selector(self,
                  title: Any,
@@ -922,44 +1308,27 @@ class WidgetManager(object):
         :param state_values: Value of each state of the switch
         :return: :py:class:`pygame_menu.widgets.ToggleSwitch`
         """
-        if isinstance(default, (int, bool)):
-            assert 0 <= default <= 1, 'default value can be 0 or 1'
-        else:
+        if not isinstance(default, int):  # bool is a subclass of int
             raise ValueError('invalid value type, default can be 0, False, 1, or True')
+        assert 0 <= default <= 1, 'default value can be 0 or 1'
 
         # Filter widget attributes to avoid passing them to the callbacks
         attributes = self._filter_widget_attributes(kwargs)
 
-        infinite = kwargs.pop('infinite', False)
-        slider_color = kwargs.pop('slider_color', (255, 255, 255))
-        slider_thickness = kwargs.pop('slider_thickness', 20)
-        state_color = kwargs.pop('state_color', ((178, 178, 178), (117, 185, 54)))
-        state_text_font_color = kwargs.pop('state_text_font_color', ((255, 255, 255), (255, 255, 255)))
-        state_text_font_size = kwargs.pop('state_text_font_size', None)
-        switch_border_color = kwargs.pop('switch_border_color', (40, 40, 40))
-        switch_border_width = kwargs.pop('switch_border_width', 1)
-        switch_height = kwargs.pop('switch_height', 1.25)
-        switch_margin = kwargs.pop('switch_margin', (25, 0))
+        switch_kwargs = {}
+        for key, default_value in _TOGGLE_SWITCH_DEFAULTS:
+            switch_kwargs[key] = kwargs.pop(key, default_value)
         width = kwargs.pop('width', 150)
 
         widget = pygame_menu.widgets.ToggleSwitch(
             default_state=default,
-            infinite=infinite,
             onchange=onchange,
-            slider_color=slider_color,
-            slider_thickness=slider_thickness,
-            state_color=state_color,
             state_text=state_text,
-            state_text_font_color=state_text_font_color,
-            state_text_font_size=state_text_font_size,
             state_values=state_values,
-            switch_border_color=switch_border_color,
-            switch_border_width=switch_border_width,
-            switch_height=switch_height,
-            switch_margin=switch_margin,
             title=title,
             state_width=int(width),
             toggleswitch_id=toggleswitch_id,
+            **switch_kwargs,
             **kwargs
         )
         self._configure_widget(widget=widget, **attributes)
@@ -1061,6 +1430,8 @@ class WidgetManager(object):
         """
         assert isinstance(default, (str, int, float))
 
+        input_type = _get_locals_value(input_type)
+
         # Filter widget attributes to avoid passing them to the callbacks
         attributes = self._filter_widget_attributes(kwargs)
         input_underline_vmargin = kwargs.pop('input_underline_vmargin', 0)
@@ -1120,7 +1491,9 @@ class WidgetManager(object):
         assert margin > 0, \
             'zero margin is not valid, prefer adding a NoneWidget menu.add.none_widget()'
 
-        attributes = self._filter_widget_attributes({'margin': (0, margin)})
+        # The margin is already checked, thus, it is set after the theme defaults
+        attributes = self._filter_widget_attributes({})
+        attributes['margin'] = (0, margin)
         widget = pygame_menu.widgets.VMargin(widget_id=margin_id)
         self._configure_widget(widget=widget, **attributes)
         self._append_widget(widget)
@@ -1189,13 +1562,14 @@ class WidgetManager(object):
             msg = 'prefer adding nested submenus using add_button method instead, unintended behaviours may occur'
             warnings.warn(msg)
 
-        # Configure widget
+        # Configure widget, this also sets the Menu and the controls
         if configure_defaults:
             self._configure_widget(widget, **self._filter_widget_attributes({}))
+        else:
+            menu = self._menu
+            widget.set_menu(menu)
+            menu._check_id_duplicated(widget.get_id())
+            widget.set_controls(menu._joystick, menu._mouse, menu._touchscreen)
 
-        widget.set_menu(self._menu)
-        self._menu._check_id_duplicated(widget.get_id())
-
-        widget.set_controls(self._menu._joystick, self._menu._mouse, self._menu._touchscreen)
         self._append_widget(widget)
         return widget
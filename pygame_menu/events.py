@@ -69,6 +69,9 @@ class MenuAction(object):
             return self._action == other._action
         return False
 
+    def __hash__(self) -> int:
+        return hash(self._action)
+
 
 def is_event(event: Any) -> bool:
     """
@@ -37,6 +37,7 @@ import os
 import sys
 import time
 import warnings
+import weakref
 
 import pygame
 import pygame.gfxdraw as gfxdraw
@@ -54,7 +55,7 @@ from pygame_menu.sound import Sound
 # Import types
 from pygame_menu._types import Callable, Any, Dict, NumberType, VectorType, Vector2NumberType, \
     Union, Tuple, List, Vector2IntType, Vector2BoolType, Tuple4Tuple2IntType, Tuple2IntType, \
-    MenuColumnMaxWidthType, MenuColumnMinWidthType, MenuRowsType, Optional, Tuple2BoolType
+    MenuColumnMaxWidthType, MenuColumnMinWidthType, MenuRowsType, Optional, Tuple2BoolType, Set
 
 # Joy events
 JOY_EVENT_LEFT = 1
@@ -154,6 +155,8 @@ class Menu(object):
     _scrollarea_margin: List[int]
     _sound: 'Sound'
     _stats: '_MenuStats'
+    _submenu_closure: Set['Menu']
+    _submenu_parents: List['weakref.ReferenceType']
     _submenus: List['Menu']
     _theme: '_themes.Theme'
     _top: 'Menu'
@@ -161,6 +164,7 @@ class Menu(object):
     _touchscreen_motion_selection: bool
     _used_columns: int
     _widget_columns: Dict[int, List['pygame_menu.widgets.Widget']]
+    _widget_ids: Set[str]
     _widget_max_position: Tuple2IntType
     _widget_min_position: Tuple2IntType
     _widget_offset: List[int]
@@ -170,6 +174,8 @@ class Menu(object):
     _widgets_surface: Optional['pygame.Surface']
     _widgets_surface_last: Tuple[int, int, Optional['pygame.Surface']]
     _widgets_surface_need_update: bool
+    _widgets_surface_version: int
+    _widgets_version: int
     _width: int
     _window_size: Tuple2IntType
     add: 'WidgetManager'
@@ -371,6 +377,13 @@ class Menu(object):
         self._stats = _MenuStats()
         self._submenus = []
         self._theme = theme
+
+        # All the menus reachable through the submenus (recursively), and the
+        # menus that contain this one as submenu. Both are updated by _add_submenu
+        # and _remove_submenu. The parents are weak references, thus, a parent
+        # Menu deleted by the user is not kept alive by its submenus
+        self._submenu_closure = set()
+        self._submenu_parents = []
         self._width = int(width)
 
         # Set callbacks
@@ -400,6 +413,7 @@ class Menu(object):
         # Menu widgets, it should not be accessed outside the object as strange issues can occur
         self.add = WidgetManager(self)
         self._widgets = []
+        self._widget_ids = set()  # IDs of the widgets, used to check duplicates
         self._widget_offset = [theme.widget_offset[0], theme.widget_offset[1]]
 
         if abs(self._widget_offset[0]) < 1:
@@ -416,6 +430,11 @@ class Menu(object):
         self._widgets_surface_need_update = False
         self._widgets_surface_last = (0, 0, None)
 
+        # Increased each time a widget is added. The widgets surface is built
+        # again on the next render if its version is different
+        self._widgets_surface_version = 0
+        self._widgets_version = 0
+
         # Precache widgets surface draw
         self._widget_surface_cache_enabled = True
         self._widget_surface_cache_need_update = True
@@ -831,6 +850,7 @@ class Menu(object):
             raise ValueError('widget is not in Menu, check if exists on the current '
                              'with menu.get_current().remove_widget(widget)')
         self._widgets.pop(index)
+        self._widget_ids.discard(widget.get_id())
         self._update_after_remove_or_hidden(index)
         self._stats.removed_widgets += 1
         widget.set_menu(None)  # Removes Menu reference from widget
@@ -1221,6 +1241,19 @@ class Menu(object):
         self._stats.total_building_time += dt
         self._stats.last_build_surface_time = dt
 
+    def _change_widget_id(self, widget_id: str, new_id: str) -> None:
+        """
+        Update the ID of a widget within the Menu IDs. Does nothing if the widget
+        has not been added yet.
+
+        :param widget_id: Current widget ID
+        :param new_id: New widget ID
+        :return: None
+        """
+        if widget_id in self._widget_ids:
+            self._widget_ids.remove(widget_id)
+            self._widget_ids.add(new_id)
+
     def _check_id_duplicated(self, widget_id: str) -> None:
         """
         Check if widget ID is duplicated. Throws ``IndexError`` if the index is duplicated.
@@ -1229,9 +1262,8 @@ class Menu(object):
         :return: None
         """
         assert isinstance(widget_id, str)
-        for widget in self._widgets:
-            if widget.get_id() == widget_id:
-                raise IndexError('widget ID="{0}" already exists on the current menu'.format(widget_id))
+        if widget_id in self._widget_ids:
+            raise IndexError('widget ID="{0}" already exists on the current menu'.format(widget_id))
 
     def _close(self) -> bool:
         """
@@ -1480,7 +1512,8 @@ class Menu(object):
         t0 = time.time()
         changed = False
 
-        if self._widgets_surface_need_update:
+        if self._widgets_surface_need_update or \
+                self._widgets_surface_version != self._widgets_version:
             self._widgets_surface = None
 
         if self._widgets_surface is None:
@@ -1489,6 +1522,7 @@ class Menu(object):
             self._build_widget_surface()
             self._stats.render_private += 1
             self._widgets_surface_need_update = False
+            self._widgets_surface_version = self._widgets_version
             changed = True
 
         self._stats.total_rendering_time += time.time() - t0
@@ -2263,7 +2297,11 @@ class Menu(object):
         if reset:
             self.full_reset()
         del self._widgets[:]
+        self._widget_ids.clear()
+        for menu in self._submenus:
+            menu._submenu_parents.remove(weakref.ref(self))
         del self._submenus[:]
+        self._update_submenu_closure()
         self._index = -1
         self._stats.clear += 1
         self._render()
@@ -2553,13 +2591,72 @@ class Menu(object):
         :param recursive: Check recursively
         :return: ``True`` if ``menu`` is in the submenus
         """
-        if menu in self._submenus:
-            return True
         if recursive:
-            for sm in self._submenus:
-                if sm.in_submenu(menu, recursive):
-                    return True
-        return False
+            return menu in self._submenu_closure
+        return menu in self._submenus
+
+    def _get_submenu_ancestors(self) -> Set['Menu']:
+        """
+        Return the Menu and all the menus that contain it as a submenu (recursively).
+
+        :return: Set of menus
+        """
+        ancestors = {self}
+        pending = [self]
+        while len(pending) > 0:
+            for parent in pending.pop()._get_submenu_parents():
+                if parent not in ancestors:
+                    ancestors.add(parent)
+                    pending.append(parent)
+        return ancestors
+
+    def _get_submenu_parents(self) -> List['Menu']:
+        """
+        Return the menus that contain this Menu as a submenu, once per button.
+        The references to deleted menus are removed.
+
+        :return: List of menus
+        """
+        parents = []
+        for ref in self._submenu_parents:
+            parent = ref()
+            if parent is not None:
+                parents.append(parent)
+        if len(parents) != len(self._submenu_parents):
+            self._submenu_parents = [weakref.ref(parent) for parent in parents]
+        return parents
+
+    def _add_submenu(self, menu: 'Menu') -> None:
+        """
+        Add a submenu to the Menu, and updates the submenu closure of the Menu
+        and all its ancestors.
+
+        :param menu: Menu to add
+        :return: None
+        """
+        self._submenus.append(menu)
+        menu._get_submenu_parents()  # Removes the deleted parents
+        menu._submenu_parents.append(weakref.ref(self))
+        reachable = menu._submenu_closure | {menu}
+        for ancestor in self._get_submenu_ancestors():
+            ancestor._submenu_closure |= reachable
+
+    def _update_submenu_closure(self) -> None:
+        """
+        Compute again the submenu closure of the Menu and all its ancestors. This
+        must be called after removing submenus.
+
+        :return: None
+        """
+        for ancestor in self._get_submenu_ancestors():
+            closure = set()
+            pending = list(ancestor._submenus)
+            while len(pending) > 0:
+                sm = pending.pop()
+                if sm not in closure:
+                    closure.add(sm)
+                    pending.extend(sm._submenus)
+            ancestor._submenu_closure = closure
 
     def _remove_submenu(self, menu: 'Menu', recursive: bool = False) -> bool:
         """
@@ -2571,6 +2668,8 @@ class Menu(object):
         """
         if menu in self._submenus:
             self._submenus.remove(menu)
+            menu._submenu_parents.remove(weakref.ref(self))
+            self._update_submenu_closure()
             self._update_after_remove_or_hidden(self._index)
             return True
         if recursive:
@@ -201,6 +201,7 @@ class Theme(object):
     :type widget_shadow_position: str
     """
     _disable_validation: bool
+    _version: int
     background_color: Union[ColorType, 'BaseImage']
     cursor_color: ColorType
     cursor_selection_color: ColorType
@@ -341,6 +342,12 @@ class Theme(object):
         # Test purpose only, if True disables any validation
         self._disable_validation = False
 
+    def __setattr__(self, key: str, value: Any) -> None:
+        super(Theme, self).__setattr__(key, value)
+        # Any change increases the theme version, this is used by the widget
+        # manager to know if the cached theme attributes must be computed again
+        self.__dict__['_version'] = self.__dict__.get('_version', 0) + 1
+
     def validate(self) -> 'Theme':
         """
         Validate the values of the theme. If there's a invalid parameter throws an
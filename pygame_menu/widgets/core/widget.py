@@ -849,6 +849,8 @@ class Widget(object):
         if self._menu is not None:
             # noinspection PyProtectedMember
             self._menu._check_id_duplicated(widget_id)
+            # noinspection PyProtectedMember
+            self._menu._change_widget_id(self._id, widget_id)
         self._id = widget_id
         return self
 
@@ -32,8 +32,10 @@ CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 __all__ = ['MenuTest']
 
 import copy
+import gc
 import unittest
 import timeit
+import weakref
 from test._utils import surface, test_reset_surface, MenuUtils, PygameUtils
 
 import pygame
@@ -674,6 +676,37 @@ class MenuTest(unittest.TestCase):
         menu.add.button('to2', menu2)
         self.assertRaises(ValueError, lambda: menu2.add.button('to1', menu))
 
+        # Test the submenu closure is updated through the ancestors
+        menu3 = MenuUtils.generic_menu()
+        btn3 = menu2.add.button('to3', menu3)
+        self.assertTrue(menu.in_submenu(menu3, recursive=True))
+        self.assertFalse(menu.in_submenu(menu3))
+        self.assertRaises(ValueError, lambda: menu3.add.button('to1', menu))
+        btn3.update_callback(lambda: None)
+        self.assertFalse(menu.in_submenu(menu3, recursive=True))
+        menu3.add.button('to1', menu)
+        self.assertTrue(menu3.in_submenu(menu2, recursive=True))
+        menu.clear()
+        self.assertFalse(menu3.in_submenu(menu2, recursive=True))
+        self.assertTrue(menu3.in_submenu(menu, recursive=True))
+
+        # The submenus do not keep alive the menus that contain them
+        settings = MenuUtils.generic_menu()
+        parents = []
+        for i in range(5):
+            parent = MenuUtils.generic_menu()
+            parent.add.button('settings', settings)
+            parents.append(weakref.ref(parent))
+        del parent
+        gc.collect()
+        self.assertEqual([p() for p in parents], [None] * 5)
+        parent = MenuUtils.generic_menu()
+        parent.add.button('settings', settings)
+        parent.add.button('settings', settings)
+        self.assertEqual(settings._get_submenu_parents(), [parent, parent])
+        self.assertEqual(len(settings._submenu_parents), 2)
+        self.assertTrue(parent.in_submenu(settings))
+
     def test_centering(self) -> None:
         """
         Test centering menu.
@@ -842,6 +875,16 @@ class MenuTest(unittest.TestCase):
         self.assertEqual(data['id2'], 1)  # Cast to int
         self.assertRaises(IndexError, lambda: self.menu.add.text_input('text1', textinput_id='id1', default=1))
 
+        # The IDs are updated after changing or removing the widgets
+        w = self.menu.add.text_input('text1', textinput_id='id_old')
+        w.change_id('id_new')
+        self.assertRaises(IndexError, lambda: self.menu.add.label('text', 'id_new'))
+        self.menu.add.label('text', 'id_old')
+        self.menu.remove_widget(w)
+        self.menu.remove_widget(self.menu.get_widget('id_old'))
+        self.menu.add.label('text', 'id_new')
+        self.menu.remove_widget(self.menu.get_widget('id_new'))
+
         self.menu.add.text_input('text1', textinput_id='id3', default=1.5, input_type=pygame_menu.locals.INPUT_FLOAT)
         data = self.menu.get_input_data(True)
         self.assertEqual(data['id3'], 1.5)  # Correct
@@ -107,3 +107,9 @@ class SelectionTest(unittest.TestCase):
         rect = w.get_rect()
         new_rect = w.get_selection_effect().inflate(rect)
         self.assertTrue(rect == new_rect)
+
+        # Widgets added without selection effect share the same object
+        w1 = self.menu.add.button('epic', None, selection_effect=None)
+        w2 = self.menu.add.label('epic', selection_effect=None)
+        self.assertIsInstance(w1.get_selection_effect(), NoneSelection)
+        self.assertIs(w1.get_selection_effect(), w2.get_selection_effect())
@@ -74,6 +74,16 @@ class ThemeTest(unittest.TestCase):
         self.assertNotEqual(theme.background_color, themecopy.background_color)
         self.assertNotEqual(theme.background_color, pygame_menu.themes.THEME_DEFAULT.background_color)
 
+    def test_version(self) -> None:
+        """
+        Test theme version increases on each change.
+        """
+        theme = pygame_menu.themes.THEME_DEFAULT.copy()
+        version = theme._version
+        theme.widget_font_size = 20
+        self.assertEqual(theme._version, version + 1)
+        self.assertEqual(theme.copy()._version, theme._version)
+
     def test_methods(self) -> None:
         """
         Test theme method.
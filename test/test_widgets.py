@@ -77,6 +77,73 @@ class WidgetsTest(unittest.TestCase):
         self.assertEqual(btn._kwargs['widget'], btn)
         btn.apply()
 
+    def test_theme_defaults(self) -> None:
+        """
+        Test the widget attributes computed from the theme.
+        """
+        theme = pygame_menu.themes.THEME_DEFAULT.copy()
+        menu = MenuUtils.generic_menu(theme=theme)
+        label = menu.add.label('label')
+        self.assertEqual(label._font_size, theme.widget_font_size)
+
+        # Changing the theme updates the next widgets
+        theme.widget_font_size = 15
+        label = menu.add.label('label')
+        self.assertEqual(label._font_size, 15)
+        label = menu.add.label('label', font_size=20)
+        self.assertEqual(label._font_size, 20)
+        self.assertRaises(AssertionError, lambda: menu.add.label('label', font_size=-1))
+
+        # The attributes of the same overridden values are reused
+        label = menu.add.label('label', font_size=20)
+        self.assertEqual(label._font_size, 20)
+        self.assertEqual(len(menu.add._attr_cache), 1)
+        menu.add.label('label', border_color=[0, 0, 0])  # Unhashable, not cached
+        self.assertEqual(len(menu.add._attr_cache), 1)
+        theme.widget_font_size = 16
+        label = menu.add.label('label', font_color=(10, 10, 10))
+        self.assertEqual(label._font_size, 16)
+        self.assertEqual(len(menu.add._attr_cache), 1)
+
+        # Values are validated even if cached, and the key considers the type
+        # of the items within tuples
+        menu.add.label('label', border_inflate=(1, 1))
+        self.assertRaises(AssertionError, lambda: menu.add.label('label', border_inflate=(1.0, 1)))
+
+        # The number of cached attributes is limited
+        for i in range(100):
+            menu.add.label('label', font_color=(i, i, i))
+        self.assertEqual(len(menu.add._attr_cache), pygame_menu._widgetmanager._ATTR_CACHE_SIZE)
+        self.assertIn(frozenset((('font_color', (tuple, ((int, 99), (int, 99), (int, 99)))),)),
+                      menu.add._attr_cache)
+
+        # Equal strings are replaced by the locals objects
+        label = menu.add.label('label', align='-'.join(('align', 'left')))
+        self.assertIs(label.get_alignment(), pygame_menu.locals.ALIGN_LEFT)
+
+    def test_batch(self) -> None:
+        """
+        Test widget addition within a batch block.
+        """
+        menu = MenuUtils.generic_menu()
+        menu.add.label('title')
+        render = menu._stats.render_private
+        surface = menu._widgets_surface
+        self.assertIsNotNone(surface)
+        with menu.add.batch():
+            for i in range(10):
+                menu.add.button('button {0}'.format(i), None)
+            with menu.add.batch():
+                menu.add.label('label')
+            self.assertEqual(menu._stats.render_private, render)
+            self.assertEqual(menu._widgets_surface, surface)
+            self.assertNotEqual(menu._widgets_surface_version, menu._widgets_version)
+        self.assertEqual(menu._stats.render_private, render + 1)
+        self.assertNotEqual(menu._widgets_surface, surface)
+        self.assertEqual(menu._widgets_surface_version, menu._widgets_version)
+        self.assertEqual(len(menu.get_widgets()), 12)
+        self.assertEqual(menu.get_selected_widget(), menu.get_widgets()[1])
+
     def test_copy(self) -> None:
         """
         Test widget copy.
@@ -699,6 +766,12 @@ class WidgetsTest(unittest.TestCase):
         for i in range(len(label)):
             self.assertEqual(label[i].get_title(), labeltext[i])
 
+        # Default ids skip the ids already used by the user
+        next_id = '_label_{0}'.format(next(pygame_menu._widgetmanager._label_id_counter) + 1)
+        self.menu.add.label('label', next_id)
+        label = self.menu.add.label('label')
+        self.assertNotEqual(label.get_id(), next_id)
+
         # Split label
         label = self.menu.add.label('This label should split.\nIn two lines')
         self.assertEqual(label[0].get_title(), 'This label should split.')
@@ -718,6 +791,15 @@ class WidgetsTest(unittest.TestCase):
         self.assertEqual(label[1].get_title(), 'long so it should split.')
         self.assertEqual(label[2].get_title(), 'The second line')
 
+        # The label used to measure the titles is reused if the attributes are equal
+        dummy = self.menu.add._autochar_label
+        self.menu.add.label('Another label', max_char=-1)
+        self.assertEqual(self.menu.add._autochar_label, dummy)
+        label = self.menu.add.label(
+            'This label should split, this line is really long so it should split.', max_char=-1, font_size=40)
+        self.assertNotEqual(self.menu.add._autochar_label, dummy)
+        self.assertEqual(label[0].get_title(), 'This label should split, this line')
+
     def test_textinput(self) -> None:
         """
         Test TextInput widget.